@@ -0,0 +1,15 @@
+# --- Gunicorn Configuration ---
+# Run with: gunicorn -c gunicorn.conf.py wsgi:app
+worker_class = "gevent"
+# Each worker has its own DB pool of up to DB_POOL_SIZE + DB_MAX_OVERFLOW
+# connections (10 + 10 by default), so 4 workers can open 80 Postgres
+# connections. Keep workers * (pool_size + max_overflow) below max_connections.
+workers = 4
+worker_connections = 500
+
+
+def worker_exit(server, worker):
+    # Flush queued consultation requests before the worker goes away.
+    from app import stop_request_flusher
+
+    stop_request_flusher()
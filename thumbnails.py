@@ -0,0 +1,22 @@
+# --- Thumbnail Generation ---
+# Kept out of app.py so the spawned thumbnail workers can unpickle
+# make_thumbnail without importing the app. Under gunicorn that keeps them to
+# Pillow; under `python app.py`, spawn still re-imports __main__ (app.py) in
+# each worker.
+import os
+
+from PIL import Image
+
+THUMBNAIL_SIZE = (400, 400)
+
+def make_thumbnail(filepath):
+    # Runs in a worker process; returns the thumbnail's filename. The name
+    # keeps the full original filename so "mat.png" and "mat.jpg" don't share
+    # a thumbnail.
+    thumb_path = f"{filepath}.thumb.webp"
+    with Image.open(filepath) as image:
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        image.thumbnail(THUMBNAIL_SIZE)
+        image.save(thumb_path, "WEBP", quality=80, method=6)
+    return os.path.basename(thumb_path)
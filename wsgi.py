@@ -0,0 +1,12 @@
+# --- Production Entrypoint ---
+# gevent has to patch the standard library before psycopg and the app are
+# imported, so the pool's sockets become cooperative. After patching, the
+# app's background "threads" (the request flusher and the thumbnail pool's
+# manager) are greenlets: they only wait on sockets, pipes and sleeps, which
+# yield to other requests. Blocking file work goes to gevent's hub threadpool
+# instead (see run_file_task), and thumbnails are encoded in child processes.
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import app  # noqa: E402